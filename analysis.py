@@ -1,17 +1,30 @@
 import pandas as pd
+import pyarrow.csv as pacsv
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib.backends.backend_pdf import PdfPages
 
-# Set style
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 6)
-plt.rcParams['font.size'] = 10
+# Copy-on-Write: filtered frames share buffers until a column is modified (always on in pandas >= 3)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# Also write the cleaned dataset as CSV alongside the Feather file
+EMIT_CSV = True
+
+# Figures always go into a single vector PDF report; PNGs are rasterized only when requested
+EMIT_PNG = True
+PNG_DPI = 150
+
+# Classify primary sectors with the Numba kernel instead of the vectorized NumPy path (requires numba)
+USE_NUMBA = False
 
 # Load the dataset
 print("Loading dataset...")
-df = pd.read_csv('/home/ubuntu/upload/project_data_set.csv')
+# Parse with PyArrow's multithreaded reader and keep the columns Arrow-backed
+table = pacsv.read_csv(
+    '/home/ubuntu/upload/project_data_set.csv',
+    read_options=pacsv.ReadOptions(block_size=1 << 20),
+    convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+)
+df = table.to_pandas(types_mapper=pd.ArrowDtype)
 
 print("\n=== INITIAL DATA EXPLORATION ===")
 print(f"Dataset shape: {df.shape}")
@@ -43,13 +56,16 @@ print(issue2)
 data_quality_issues.append(issue2)
 
 # Issue 3: Forest/Park entries mixed with county data
-forest_parks = df[df['Counties'].str.contains('FOREST|PARK|NATIONAL', case=False, na=False)]
+# Computed once (by Arrow's regex kernel); the mask is reused in cleaning Step 2
+NON_COUNTY_PATTERN = r'FOREST|PARK|NATIONAL'
+non_county_mask = df['Counties'].str.contains(NON_COUNTY_PATTERN, case=False, na=False)
+forest_parks = df[non_county_mask]
 issue3 = f"Issue 3: Non-county administrative units mixed with county data - {len(forest_parks)} entries are forests/parks/reserves rather than counties: {forest_parks['Counties'].tolist()}"
 print(issue3)
 data_quality_issues.append(issue3)
 
 # Issue 4: Data type issues - numeric columns may have been read as objects
-numeric_cols = df.columns[1:]  # All columns except Counties
+numeric_cols = df.columns.drop('Counties')
 non_numeric = []
 for col in numeric_cols:
     if df[col].dtype == 'object':
@@ -75,27 +91,18 @@ cleaning_steps = []
 # Step 1: Fix column names
 print("\nStep 1: Fixing column names...")
 df.columns = df.columns.str.strip()  # Remove leading/trailing spaces
-# First, handle specific renames
-column_mapping = {}
-for col in df.columns:
-    if col == 'Counties':
-        column_mapping[col] = 'County'
-    elif col == 'TOTAL HOUSHOLDS':
-        column_mapping[col] = 'Total_Households'
-    elif col == 'Exotic cattle 0Dairy':
-        column_mapping[col] = 'Exotic_Cattle_Dairy'
-    elif col == 'Exotic cattle 0Beef':
-        column_mapping[col] = 'Exotic_Cattle_Beef'
-    elif col == 'Population (2019)':
-        column_mapping[col] = 'Population_2019'
-    elif col == 'Area sq km':
-        column_mapping[col] = 'Area_sq_km'
-    elif col == 'density per sq km':
-        column_mapping[col] = 'Density_per_sq_km'
-    else:
-        # Standardize other column names
-        new_col = col.replace(' ', '_').replace('-', '_').replace('/', '_')
-        column_mapping[col] = new_col
+# Specific renames for typos/odd names; other columns are standardized by replacing separators
+COLUMN_RENAMES = {
+    'Counties': 'County',
+    'TOTAL HOUSHOLDS': 'Total_Households',
+    'Exotic cattle 0Dairy': 'Exotic_Cattle_Dairy',
+    'Exotic cattle 0Beef': 'Exotic_Cattle_Beef',
+    'Population (2019)': 'Population_2019',
+    'Area sq km': 'Area_sq_km',
+    'density per sq km': 'Density_per_sq_km'
+}
+separator_table = str.maketrans({' ': '_', '-': '_', '/': '_'})
+column_mapping = {col: COLUMN_RENAMES.get(col, col.translate(separator_table)) for col in df.columns}
 
 df = df.rename(columns=column_mapping)
 step1 = "Step 1: Standardized column names - Fixed typos, removed spaces, standardized naming convention to snake_case"
@@ -104,7 +111,7 @@ print(step1)
 
 # Step 2: Remove forest/park entries (non-county administrative units)
 print("\nStep 2: Removing non-county entries...")
-df_clean = df[~df['County'].str.contains('FOREST|PARK|NATIONAL', case=False, na=False)].copy()
+df_clean = df[~non_county_mask]
 removed_count = len(df) - len(df_clean)
 step2 = f"Step 2: Removed non-county administrative units - Excluded {removed_count} forest/park entries to focus on county-level analysis"
 cleaning_steps.append(step2)
@@ -119,9 +126,8 @@ print(f"Counties with missing critical data: {missing_critical['County'].tolist(
 # Remove rows with missing population or area as these are critical for analysis
 df_clean = df_clean.dropna(subset=['Population_2019', 'Area_sq_km'])
 
-# For other missing values in agricultural data, fill with 0 (assuming no activity if not reported)
-agricultural_cols = df_clean.columns[1:-3]  # Exclude County and last 3 demographic columns
-df_clean[agricultural_cols] = df_clean[agricultural_cols].fillna(0)
+# Other missing values in agricultural data are filled with 0 (assuming no activity if not reported);
+# the fill is fused with the type coercion in Step 4 so the numeric block is only rewritten once
 
 step3 = f"Step 3: Handled missing values - Removed {len(missing_critical)} counties with missing critical demographic data; filled missing agricultural data with 0 (assuming no activity if unreported)"
 cleaning_steps.append(step3)
@@ -129,12 +135,20 @@ print(step3)
 
 # Step 4: Convert data types
 print("\nStep 4: Converting data types...")
-# Ensure all numeric columns are numeric
-for col in df_clean.columns[1:]:
-    df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
+# Numeric column list, resolved once here and reused by the validation and downcast steps
+NUM_COLS = df_clean.columns.drop('County').tolist()
+def coerce_numeric(col):
+    """
+    pd.to_numeric(errors='coerce') that marks unparseable cells as missing.
+    
+    Arrow-backed columns hold coerced failures as NaN rather than null, which fillna skips,
+    so NaN is masked to null here.
+    """
+    col = pd.to_numeric(col, errors='coerce')
+    return col.mask(np.isnan(col.to_numpy(dtype=np.float64, na_value=0.0)))
 
-# Fill any NaN created by coercion with 0
-df_clean = df_clean.fillna(0)
+# Ensure all numeric columns are numeric and fill missing/coerced values with 0 in a single pass
+df_clean[NUM_COLS] = df_clean[NUM_COLS].apply(coerce_numeric).fillna(0)
 
 step4 = "Step 4: Converted data types - Ensured all numeric columns are properly typed as numeric, coerced any non-numeric values"
 cleaning_steps.append(step4)
@@ -143,41 +157,88 @@ print(step4)
 # Step 5: Validate and handle outliers
 print("\nStep 5: Validating data and checking outliers...")
 # Check for negative values
-negative_counts = (df_clean.select_dtypes(include=[np.number]) < 0).sum().sum()
+negative_counts = int((df_clean[NUM_COLS].to_numpy(dtype=np.float64) < 0).sum())
 print(f"Negative values found: {negative_counts}")
 
 # Recalculate density to ensure consistency
 df_clean['Density_per_sq_km'] = df_clean['Population_2019'] / df_clean['Area_sq_km']
 
-step5 = "Step 5: Validated data integrity - Checked for negative values, recalculated population density for consistency"
+# Downcast household/population counts to the smallest unsigned integer type that holds them;
+# Area and density stay float64 since they feed the ratio metrics below
+count_cols = [col for col in NUM_COLS if col not in ('Area_sq_km', 'Density_per_sq_km')]
+for col in count_cols:
+    df_clean[col] = pd.to_numeric(df_clean[col], downcast='unsigned')
+
+step5 = "Step 5: Validated data integrity - Checked for negative values, recalculated population density for consistency, downcast count columns to compact unsigned integer types"
 cleaning_steps.append(step5)
 print(step5)
 
 print(f"\nCleaned dataset shape: {df_clean.shape}")
 print(f"Original dataset shape: {df.shape}")
 
-# Save cleaned dataset
-output_path = '/home/ubuntu/agricultural_analysis/cleaned_project_dataset.csv'
-df_clean.to_csv(output_path, index=False)
+# Save cleaned dataset - Feather is the primary artifact; CSV is kept for downstream consumers
+output_path = '/home/ubuntu/agricultural_analysis/cleaned_project_dataset.feather'
+df_clean.reset_index(drop=True).to_feather(output_path)
 print(f"\nCleaned dataset saved to: {output_path}")
 
+if EMIT_CSV:
+    csv_output_path = '/home/ubuntu/agricultural_analysis/cleaned_project_dataset.csv'
+    df_clean.to_csv(csv_output_path, index=False)
+    print(f"Cleaned dataset (CSV) saved to: {csv_output_path}")
+
 # ============================================================
 # DESCRIPTIVE ANALYSIS
 # ============================================================
 
 print("\n\n=== DESCRIPTIVE ANALYSIS ===")
 
+# Derived ratio columns used by the indicators and policy metrics, computed in one pass on NumPy arrays
+# (Density_per_sq_km is recalculated in Step 5 since it is part of the saved cleaned dataset)
+pop = df_clean['Population_2019'].to_numpy(dtype=np.float64)
+hh = df_clean['Total_Households'].to_numpy(dtype=np.float64)
+farm = df_clean['Farming'].to_numpy(dtype=np.float64)
+crop = df_clean['Crop_Production'].to_numpy(dtype=np.float64)
+area = df_clean['Area_sq_km'].to_numpy(dtype=np.float64)
+df_clean = df_clean.assign(
+    Avg_Household_Size=pop / hh,
+    Agricultural_Specialization_Index=farm / hh * 100,
+    Crop_Intensity=crop / area
+)
+
+def top_k(data, col, k):
+    """
+    Return the k rows of data with the largest values in col, in descending order.
+    
+    Equivalent to data.nlargest(k, col) (earlier rows win ties; NaN rows only fill in, in row
+    order, when fewer than k values are present) but selects with an O(N) partition over the
+    non-NaN values and only sorts the k winners.
+    """
+    vals = data[col].to_numpy(dtype=np.float64)
+    is_nan = np.isnan(vals)
+    valid = np.flatnonzero(~is_nan)
+    vals = vals[valid]
+    if k < len(vals):
+        kth = np.partition(vals, -k)[-k]
+        above = np.flatnonzero(vals > kth)
+        ties = np.flatnonzero(vals == kth)[:k - len(above)]
+        idx = np.concatenate([above, ties])
+    else:
+        idx = np.arange(len(vals))
+    idx = idx[np.argsort(-vals[idx], kind='stable')]
+    rows = valid[idx]
+    if k > len(vals):
+        rows = np.concatenate([rows, np.flatnonzero(is_nan)[:k - len(vals)]])
+    return data.iloc[rows]
+
 # Indicator 1: Total households engaged in farming
 total_farming_households = df_clean['Farming'].sum()
 print(f"\nIndicator 1 - Total Households Engaged in Farming: {total_farming_households:,.0f}")
 
 # Indicator 2: Average household size (Population / Total Households)
-df_clean['Avg_Household_Size'] = df_clean['Population_2019'] / df_clean['Total_Households']
 avg_household_size = df_clean['Avg_Household_Size'].mean()
 print(f"Indicator 2 - Average Household Size Across Counties: {avg_household_size:.2f} persons/household")
 
 # Indicator 3: Agricultural Specialization Index (Farming households / Total households)
-df_clean['Agricultural_Specialization_Index'] = (df_clean['Farming'] / df_clean['Total_Households']) * 100
 avg_specialization = df_clean['Agricultural_Specialization_Index'].mean()
 print(f"Indicator 3 - Average Agricultural Specialization Index: {avg_specialization:.2f}% (percentage of households engaged in farming)")
 
@@ -187,34 +248,64 @@ print(f"Indicator 3 - Average Agricultural Specialization Index: {avg_specializa
 
 print("\n\n=== CREATING VISUALIZATIONS ===")
 
+# Plotting libraries are imported here so the loading/cleaning steps don't pay their import cost;
+# selecting Agg first skips interactive backend probing
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import seaborn as sns
+from matplotlib.backends.backend_pdf import PdfPages
+
+# Set style
+sns.set_style("whitegrid")
+plt.rcParams['figure.figsize'] = (12, 6)
+plt.rcParams['font.size'] = 10
+# Shared axis label/title styling, set once instead of per call
+plt.rcParams.update({
+    'axes.labelsize': 12,
+    'axes.labelweight': 'bold',
+    'axes.titlesize': 14,
+    'axes.titleweight': 'bold',
+    'axes.titlepad': 20
+})
+
+report_path = '/home/ubuntu/agricultural_analysis/report.pdf'
+# Figures are held until the last one is drawn and then written to the PDF in one block,
+# so a failure part-way through never leaves a truncated report behind
+report_figures = []
+
+def save_figure(fig, filename):
+    """Queue a figure for the PDF report and optionally write it as a PNG."""
+    if EMIT_PNG:
+        fig.savefig(f'/home/ubuntu/agricultural_analysis/{filename}', dpi=PNG_DPI, bbox_inches='tight')
+        print(f"Saved: {filename}")
+    report_figures.append(fig)
+
 # Visualization 1: Top 10 Counties by Crop Production
 print("\nCreating Visualization 1: Top 10 Counties by Crop Production...")
-top10_crop = df_clean.nlargest(10, 'Crop_Production')[['County', 'Crop_Production']]
+top10_crop = top_k(df_clean, 'Crop_Production', 10)[['County', 'Crop_Production']]
 print(top10_crop)
 
 fig1, ax1 = plt.subplots(figsize=(12, 6))
 bars = ax1.barh(top10_crop['County'], top10_crop['Crop_Production'], color='#2E7D32')
-ax1.set_xlabel('Number of Households Engaged in Crop Production', fontsize=12, fontweight='bold')
-ax1.set_ylabel('County', fontsize=12, fontweight='bold')
-ax1.set_title('Top 10 Counties by Households Engaged in Crop Production', fontsize=14, fontweight='bold', pad=20)
+ax1.set_xlabel('Number of Households Engaged in Crop Production')
+ax1.set_ylabel('County')
+ax1.set_title('Top 10 Counties by Households Engaged in Crop Production')
 ax1.invert_yaxis()
 # Add value labels
-for i, (idx, row) in enumerate(top10_crop.iterrows()):
-    ax1.text(row['Crop_Production'], i, f" {row['Crop_Production']:,.0f}", 
-             va='center', fontsize=10, fontweight='bold')
+ax1.bar_label(bars, labels=[f'{v:,.0f}' for v in top10_crop['Crop_Production'].to_numpy()],
+              padding=3, fontsize=10, fontweight='bold')
 plt.tight_layout()
-plt.savefig('/home/ubuntu/agricultural_analysis/viz1_top10_crop_production.png', dpi=300, bbox_inches='tight')
-print("Saved: viz1_top10_crop_production.png")
-plt.close()
+save_figure(fig1, 'viz1_top10_crop_production.png')
 
 # Visualization 2: Comparison of Major Agricultural Sub-sectors
 print("\nCreating Visualization 2: Agricultural Sub-sectors Comparison...")
-subsector_totals = {
-    'Crop Production': df_clean['Crop_Production'].sum(),
-    'Livestock Production': df_clean['Livestock_Production'].sum(),
-    'Aquaculture': df_clean['Aquaculture'].sum(),
-    'Fishing': df_clean['Fishing'].sum()
-}
+SECTOR_COLS = ['Crop_Production', 'Livestock_Production', 'Aquaculture', 'Fishing']
+# One reduction over the four sub-sector columns instead of four separate sums
+subsector_totals = df_clean[SECTOR_COLS].sum().rename({
+    'Crop_Production': 'Crop Production',
+    'Livestock_Production': 'Livestock Production'
+}).to_dict()
 print(subsector_totals)
 
 fig2, (ax2a, ax2b) = plt.subplots(1, 2, figsize=(14, 6))
@@ -223,47 +314,36 @@ fig2, (ax2a, ax2b) = plt.subplots(1, 2, figsize=(14, 6))
 subsector_df = pd.DataFrame(list(subsector_totals.items()), columns=['Sub-sector', 'Households'])
 colors = ['#2E7D32', '#F57C00', '#0277BD', '#C62828']
 bars = ax2a.bar(subsector_df['Sub-sector'], subsector_df['Households'], color=colors)
-ax2a.set_ylabel('Total Households', fontsize=12, fontweight='bold')
-ax2a.set_title('Total Households by Agricultural Sub-sector', fontsize=13, fontweight='bold')
+ax2a.set_ylabel('Total Households')
+ax2a.set_title('Total Households by Agricultural Sub-sector', fontsize=13, pad=6)
 ax2a.tick_params(axis='x', rotation=45)
 # Add value labels
-for bar in bars:
-    height = bar.get_height()
-    ax2a.text(bar.get_x() + bar.get_width()/2., height,
-             f'{height:,.0f}',
-             ha='center', va='bottom', fontsize=10, fontweight='bold')
+ax2a.bar_label(bars, fmt='{:,.0f}', fontsize=10, fontweight='bold')
 
 # Pie chart
 ax2b.pie(subsector_df['Households'], labels=subsector_df['Sub-sector'], autopct='%1.1f%%',
          colors=colors, startangle=90, textprops={'fontsize': 10, 'fontweight': 'bold'})
-ax2b.set_title('Distribution of Households Across Sub-sectors', fontsize=13, fontweight='bold')
+ax2b.set_title('Distribution of Households Across Sub-sectors', fontsize=13, pad=6)
 
 plt.tight_layout()
-plt.savefig('/home/ubuntu/agricultural_analysis/viz2_subsector_comparison.png', dpi=300, bbox_inches='tight')
-print("Saved: viz2_subsector_comparison.png")
-plt.close()
+save_figure(fig2, 'viz2_subsector_comparison.png')
 
 # Additional visualization: Agricultural Specialization by County (Top 15)
 print("\nCreating Additional Visualization: Agricultural Specialization Index...")
-top15_spec = df_clean.nlargest(15, 'Agricultural_Specialization_Index')[['County', 'Agricultural_Specialization_Index']]
+top15_spec = top_k(df_clean, 'Agricultural_Specialization_Index', 15)[['County', 'Agricultural_Specialization_Index']]
 
 fig3, ax3 = plt.subplots(figsize=(12, 7))
 bars = ax3.barh(top15_spec['County'], top15_spec['Agricultural_Specialization_Index'], 
                 color='#1565C0')
-ax3.set_xlabel('Agricultural Specialization Index (%)', fontsize=12, fontweight='bold')
-ax3.set_ylabel('County', fontsize=12, fontweight='bold')
-ax3.set_title('Top 15 Counties by Agricultural Specialization Index\n(% of Households Engaged in Farming)', 
-              fontsize=14, fontweight='bold', pad=20)
+ax3.set_xlabel('Agricultural Specialization Index (%)')
+ax3.set_ylabel('County')
+ax3.set_title('Top 15 Counties by Agricultural Specialization Index\n(% of Households Engaged in Farming)')
 ax3.invert_yaxis()
 # Add value labels
-for i, (idx, row) in enumerate(top15_spec.iterrows()):
-    ax3.text(row['Agricultural_Specialization_Index'], i, 
-             f" {row['Agricultural_Specialization_Index']:.1f}%", 
-             va='center', fontsize=9, fontweight='bold')
+ax3.bar_label(bars, labels=[f'{v:.1f}%' for v in top15_spec['Agricultural_Specialization_Index'].to_numpy()],
+              padding=3, fontsize=9, fontweight='bold')
 plt.tight_layout()
-plt.savefig('/home/ubuntu/agricultural_analysis/viz3_specialization_index.png', dpi=300, bbox_inches='tight')
-print("Saved: viz3_specialization_index.png")
-plt.close()
+save_figure(fig3, 'viz3_specialization_index.png')
 
 # ============================================================
 # PART 2: PRIMARY AGRICULTURAL SECTOR CLASSIFICATION
@@ -274,9 +354,94 @@ print("\n\n=== PART 2: PRIMARY AGRICULTURAL SECTOR CLASSIFICATION ===")
 # Define Primary Agricultural Sector based on dominant activity
 print("\nDefining Primary Agricultural Sector...")
 
-def classify_primary_sector(row):
+# Optional: compiled sector classifier, only imported when USE_NUMBA is set
+njit = None
+if USE_NUMBA:
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+
+SECTOR_NAMES = np.array(['Crop', 'Livestock', 'Aquaculture', 'Fishing'])
+# Codes 0-3 are '<sector> Dominant' in SECTOR_COLS order; used by the Numba kernel's int8 output
+SECTOR_LABELS = np.array([
+    'Crop Dominant', 'Livestock Dominant', 'Aquaculture Dominant', 'Fishing Dominant',
+    'Crop-Livestock Mixed', 'Mixed Agriculture', 'No Agriculture'
+])
+CROP_LIVESTOCK_MIXED, MIXED_AGRICULTURE, NO_AGRICULTURE = 4, 5, 6
+
+def classify_sectors_numpy(arr):
+    """Classify rows of an (N, 4) sub-sector array with whole-column NumPy operations."""
+    rows = np.arange(len(arr))
+    
+    # Top two household counts via a partial sort; argmax returns the first maximum,
+    # so ties keep SECTOR_COLS order
+    top_two = np.partition(arr, -2, axis=1)
+    dominant = top_two[:, -1]
+    second = top_two[:, -2]
+    dom_idx = np.argmax(arr, axis=1)
+    masked = arr.copy()
+    masked[rows, dom_idx] = -np.inf
+    sec_idx = np.argmax(masked, axis=1)
+    
+    both_active = (dominant > 0) & (second > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(second > 0, dominant / second, np.inf)
+    
+    crop_livestock_close = both_active & (dom_idx < 2) & (sec_idx < 2) & (ratio < 1.2)
+    clearly_dominant = (dominant > 0) & (~both_active | (ratio >= 1.5))
+    
+    dominant_labels = np.char.add(SECTOR_NAMES[dom_idx], ' Dominant')
+    return np.select(
+        [crop_livestock_close, clearly_dominant, both_active],
+        [np.full(len(arr), 'Crop-Livestock Mixed'), dominant_labels, np.full(len(arr), 'Mixed Agriculture')],
+        default='No Agriculture'
+    )
+
+if njit is not None:
+    def _classify_sector_codes(arr, out):
+        for i in range(arr.shape[0]):
+            # Dominant and second sector; strict '>' keeps the first sector on ties
+            dom = 0
+            for j in range(1, 4):
+                if arr[i, j] > arr[i, dom]:
+                    dom = j
+            sec = 1 if dom == 0 else 0
+            for j in range(4):
+                if j != dom and arr[i, j] > arr[i, sec]:
+                    sec = j
+            dominant = arr[i, dom]
+            second = arr[i, sec]
+            
+            if dominant > 0 and second > 0:
+                ratio = dominant / second
+                if dom < 2 and sec < 2 and ratio < 1.2:
+                    out[i] = CROP_LIVESTOCK_MIXED
+                elif ratio >= 1.5:
+                    out[i] = dom
+                else:
+                    out[i] = MIXED_AGRICULTURE
+            elif dominant > 0:
+                out[i] = dom
+            else:
+                out[i] = NO_AGRICULTURE
+
+    # Cache the compiled kernel on disk; without a cache locator (source not loaded from a file),
+    # compile without caching instead
+    try:
+        _classify_sector_codes = njit(cache=True)(_classify_sector_codes)
+    except RuntimeError:
+        _classify_sector_codes = njit(_classify_sector_codes)
+
+    def classify_sectors_numba(arr):
+        """Classify rows of an (N, 4) sub-sector array with a compiled per-row kernel."""
+        codes = np.empty(len(arr), dtype=np.int8)
+        _classify_sector_codes(arr, codes)
+        return SECTOR_LABELS[codes]
+
+def classify_primary_sector(data):
     """
-    Classify county's primary agricultural sector based on household engagement.
+    Classify each county's primary agricultural sector based on household engagement.
     
     Logic:
     1. Compare the four main sub-sectors: Crop, Livestock, Aquaculture, Fishing
@@ -284,44 +449,19 @@ def classify_primary_sector(row):
     3. Apply threshold: dominant sector must have at least 50% more households than second-largest
     4. If threshold not met, classify as 'Mixed Agriculture'
     5. Special case: If Crop and Livestock are close (within 20%), classify as 'Crop-Livestock Mixed'
-    """
-    crop = row['Crop_Production']
-    livestock = row['Livestock_Production']
-    aquaculture = row['Aquaculture']
-    fishing = row['Fishing']
-    
-    sectors = {
-        'Crop': crop,
-        'Livestock': livestock,
-        'Aquaculture': aquaculture,
-        'Fishing': fishing
-    }
-    
-    # Sort sectors by household count
-    sorted_sectors = sorted(sectors.items(), key=lambda x: x[1], reverse=True)
-    dominant = sorted_sectors[0]
-    second = sorted_sectors[1]
     
-    # If dominant sector has at least 50% more households than second
-    if dominant[1] > 0 and second[1] > 0:
-        ratio = dominant[1] / second[1]
-        
-        # Special case: Crop and Livestock are close
-        if dominant[0] in ['Crop', 'Livestock'] and second[0] in ['Crop', 'Livestock']:
-            if ratio < 1.2:  # Within 20% of each other
-                return 'Crop-Livestock Mixed'
-        
-        # Dominant sector is clearly leading
-        if ratio >= 1.5:
-            return f'{dominant[0]} Dominant'
-        else:
-            return 'Mixed Agriculture'
-    elif dominant[1] > 0:
-        return f'{dominant[0]} Dominant'
+    Uses the Numba kernel when USE_NUMBA is set and numba is installed, otherwise the
+    vectorized NumPy path;
+    both break ties in SECTOR_COLS order.
+    """
+    arr = np.ascontiguousarray(data[SECTOR_COLS].to_numpy(dtype=np.float64))
+    if njit is not None:
+        labels = classify_sectors_numba(arr)
     else:
-        return 'No Agriculture'
+        labels = classify_sectors_numpy(arr)
+    return pd.Categorical(labels)
 
-df_clean['Primary_Agricultural_Sector'] = df_clean.apply(classify_primary_sector, axis=1)
+df_clean['Primary_Agricultural_Sector'] = classify_primary_sector(df_clean)
 
 # Display distribution
 sector_distribution = df_clean['Primary_Agricultural_Sector'].value_counts()
@@ -333,20 +473,14 @@ print("\nCreating visualization for Primary Agricultural Sector distribution..."
 fig4, ax4 = plt.subplots(figsize=(10, 6))
 bars = ax4.bar(sector_distribution.index, sector_distribution.values, 
                color=['#2E7D32', '#F57C00', '#0277BD', '#7B1FA2'])
-ax4.set_ylabel('Number of Counties', fontsize=12, fontweight='bold')
-ax4.set_xlabel('Primary Agricultural Sector', fontsize=12, fontweight='bold')
-ax4.set_title('Distribution of Counties by Primary Agricultural Sector', fontsize=14, fontweight='bold', pad=20)
+ax4.set_ylabel('Number of Counties')
+ax4.set_xlabel('Primary Agricultural Sector')
+ax4.set_title('Distribution of Counties by Primary Agricultural Sector')
 ax4.tick_params(axis='x', rotation=45)
 # Add value labels
-for bar in bars:
-    height = bar.get_height()
-    ax4.text(bar.get_x() + bar.get_width()/2., height,
-             f'{int(height)}',
-             ha='center', va='bottom', fontsize=11, fontweight='bold')
+ax4.bar_label(bars, fmt='{:.0f}', fontsize=11, fontweight='bold')
 plt.tight_layout()
-plt.savefig('/home/ubuntu/agricultural_analysis/viz4_primary_sector_distribution.png', dpi=300, bbox_inches='tight')
-print("Saved: viz4_primary_sector_distribution.png")
-plt.close()
+save_figure(fig4, 'viz4_primary_sector_distribution.png')
 
 # ============================================================
 # POLICY-RELEVANT METRICS
@@ -361,8 +495,8 @@ print("Formula: Crop_Production / Area_sq_km")
 print("Unit: Households per sq km")
 print("Interpretation: Higher values indicate more intensive crop farming activity relative to land area")
 
-df_clean['Crop_Intensity'] = df_clean['Crop_Production'] / df_clean['Area_sq_km']
-top5_crop_intensity = df_clean.nlargest(5, 'Crop_Intensity')[['County', 'Crop_Production', 'Area_sq_km', 'Crop_Intensity']]
+# Crop_Intensity is computed with the other derived columns in the descriptive analysis
+top5_crop_intensity = top_k(df_clean, 'Crop_Intensity', 5)[['County', 'Crop_Production', 'Area_sq_km', 'Crop_Intensity']]
 
 print("\nTop 5 Counties by Crop Yield Potential Intensity:")
 print(top5_crop_intensity.to_string(index=False))
@@ -387,16 +521,22 @@ print("Interpretation: Measures the extent to which a county's population depend
 # We already calculated this as Agricultural_Specialization_Index
 # Now let's analyze correlation with population density
 
-from scipy import stats
+from scipy.stats import t as tdist
 
-# Calculate correlation
-correlation = stats.pearsonr(df_clean['Agricultural_Specialization_Index'], df_clean['Density_per_sq_km'])
+# Calculate correlation on contiguous float64 arrays; p-value from the t-statistic (two-sided)
+x = np.ascontiguousarray(df_clean['Density_per_sq_km'].to_numpy(), dtype=np.float64)
+y = np.ascontiguousarray(df_clean['Agricultural_Specialization_Index'].to_numpy(), dtype=np.float64)
+n = len(x)
+r = np.corrcoef(x, y)[0, 1]
+t_stat = r * np.sqrt((n - 2) / (1 - r * r))
+p_value = 2 * tdist.sf(abs(t_stat), n - 2)
+correlation = (r, p_value)
 print(f"\nCorrelation between Agricultural Engagement Rate and Population Density:")
 print(f"Pearson correlation coefficient: {correlation[0]:.3f}")
 print(f"P-value: {correlation[1]:.4f}")
 
 # Top 5 by Agricultural Engagement Rate
-top5_engagement = df_clean.nlargest(5, 'Agricultural_Specialization_Index')[
+top5_engagement = top_k(df_clean, 'Agricultural_Specialization_Index', 5)[
     ['County', 'Farming', 'Total_Households', 'Agricultural_Specialization_Index', 'Density_per_sq_km']
 ]
 
@@ -421,27 +561,31 @@ fig5, ax5 = plt.subplots(figsize=(10, 7))
 scatter = ax5.scatter(df_clean['Density_per_sq_km'], 
                       df_clean['Agricultural_Specialization_Index'],
                       s=100, alpha=0.6, c=df_clean['Farming'], cmap='YlGn', edgecolors='black', linewidth=0.5)
-ax5.set_xlabel('Population Density (persons per sq km)', fontsize=12, fontweight='bold')
-ax5.set_ylabel('Agricultural Engagement Rate (%)', fontsize=12, fontweight='bold')
-ax5.set_title(f'Agricultural Engagement vs Population Density\n(Correlation: {correlation[0]:.3f})', 
-              fontsize=14, fontweight='bold', pad=20)
+ax5.set_xlabel('Population Density (persons per sq km)')
+ax5.set_ylabel('Agricultural Engagement Rate (%)')
+ax5.set_title(f'Agricultural Engagement vs Population Density\n(Correlation: {correlation[0]:.3f})')
 
-# Add trend line
-z = np.polyfit(df_clean['Density_per_sq_km'], df_clean['Agricultural_Specialization_Index'], 1)
-p = np.poly1d(z)
-ax5.plot(df_clean['Density_per_sq_km'], p(df_clean['Density_per_sq_km']), 
-         "r--", alpha=0.8, linewidth=2, label=f'Trend line')
+# Add trend line (closed-form least squares on the x/y arrays used for the correlation)
+xm = x.mean()
+ym = y.mean()
+slope = ((x - xm) * (y - ym)).sum() / ((x - xm) ** 2).sum()
+intercept = ym - slope * xm
+ax5.plot(x, slope * x + intercept, "r--", alpha=0.8, linewidth=2, label='Trend line')
 
 # Add colorbar
 cbar = plt.colorbar(scatter, ax=ax5)
-cbar.set_label('Number of Farming Households', fontsize=11, fontweight='bold')
+cbar.set_label('Number of Farming Households', fontsize=11)
 
 ax5.legend(fontsize=10)
 ax5.grid(True, alpha=0.3)
 plt.tight_layout()
-plt.savefig('/home/ubuntu/agricultural_analysis/viz5_engagement_vs_density.png', dpi=300, bbox_inches='tight')
-print("Saved: viz5_engagement_vs_density.png")
-plt.close()
+save_figure(fig5, 'viz5_engagement_vs_density.png')
+
+with PdfPages(report_path) as report_pdf:
+    for fig in report_figures:
+        report_pdf.savefig(fig, bbox_inches='tight')
+        plt.close(fig)
+print(f"Saved: {report_path}")
 
 # ============================================================
 # SUMMARY STATISTICS FOR PRESENTATION
@@ -449,61 +593,66 @@ plt.close()
 
 print("\n\n=== SUMMARY STATISTICS ===")
 
+# Reduce all summed columns in one pass and index into the result
+totals = df_clean[['Farming', 'Population_2019'] + SECTOR_COLS].sum()
 summary_stats = {
     'Total Counties Analyzed': len(df_clean),
-    'Total Farming Households': f"{df_clean['Farming'].sum():,.0f}",
-    'Total Population (2019)': f"{df_clean['Population_2019'].sum():,.0f}",
+    'Total Farming Households': f"{totals['Farming']:,.0f}",
+    'Total Population (2019)': f"{totals['Population_2019']:,.0f}",
     'Average Agricultural Engagement Rate': f"{df_clean['Agricultural_Specialization_Index'].mean():.1f}%",
-    'Total Crop Production Households': f"{df_clean['Crop_Production'].sum():,.0f}",
-    'Total Livestock Production Households': f"{df_clean['Livestock_Production'].sum():,.0f}",
-    'Total Aquaculture Households': f"{df_clean['Aquaculture'].sum():,.0f}",
-    'Total Fishing Households': f"{df_clean['Fishing'].sum():,.0f}",
+    'Total Crop Production Households': f"{totals['Crop_Production']:,.0f}",
+    'Total Livestock Production Households': f"{totals['Livestock_Production']:,.0f}",
+    'Total Aquaculture Households': f"{totals['Aquaculture']:,.0f}",
+    'Total Fishing Households': f"{totals['Fishing']:,.0f}",
 }
 
 print("\nKey Summary Statistics:")
 for key, value in summary_stats.items():
     print(f"{key}: {value}")
 
-# Save summary to file
-with open('/home/ubuntu/agricultural_analysis/summary_statistics.txt', 'w') as f:
-    f.write("AGRICULTURAL PRODUCTION ANALYSIS - SUMMARY STATISTICS\n")
-    f.write("="*60 + "\n\n")
-    
-    f.write("DATA QUALITY ISSUES IDENTIFIED:\n")
-    for i, issue in enumerate(data_quality_issues, 1):
-        f.write(f"{i}. {issue}\n\n")
-    
-    f.write("\n" + "="*60 + "\n\n")
-    f.write("CLEANING STEPS TAKEN:\n")
-    for i, step in enumerate(cleaning_steps, 1):
-        f.write(f"{i}. {step}\n\n")
-    
-    f.write("\n" + "="*60 + "\n\n")
-    f.write("KEY DESCRIPTIVE INDICATORS:\n")
-    for key, value in summary_stats.items():
-        f.write(f"{key}: {value}\n")
-    
-    f.write("\n" + "="*60 + "\n\n")
-    f.write("PRIMARY AGRICULTURAL SECTOR CLASSIFICATION LOGIC:\n")
-    f.write("1. Compare four main sub-sectors: Crop, Livestock, Aquaculture, Fishing\n")
-    f.write("2. Identify dominant sector with highest household count\n")
-    f.write("3. Apply threshold: dominant sector must have ≥50% more households than second-largest\n")
-    f.write("4. If threshold not met, classify as 'Mixed Agriculture'\n")
-    f.write("5. Special case: If Crop and Livestock within 20%, classify as 'Crop-Livestock Mixed'\n\n")
-    
-    f.write("SECTOR DISTRIBUTION:\n")
-    f.write(sector_distribution.to_string())
-    
-    f.write("\n\n" + "="*60 + "\n\n")
-    f.write("POLICY-RELEVANT METRICS:\n\n")
-    f.write("METRIC 1: Crop Yield Potential Intensity\n")
-    f.write("Top 5 Counties:\n")
-    f.write(top5_crop_intensity.to_string(index=False))
-    
-    f.write("\n\nMETRIC 2: Agricultural Engagement Rate\n")
-    f.write("Top 5 Counties:\n")
-    f.write(top5_engagement.to_string(index=False))
-    f.write(f"\n\nCorrelation with Population Density: {correlation[0]:.3f} (p={correlation[1]:.4f})")
+# Save summary to file - build the report in memory and write it with a single call
+summary_parts = []
+summary_parts.append("AGRICULTURAL PRODUCTION ANALYSIS - SUMMARY STATISTICS\n")
+summary_parts.append("="*60 + "\n\n")
+
+summary_parts.append("DATA QUALITY ISSUES IDENTIFIED:\n")
+for i, issue in enumerate(data_quality_issues, 1):
+    summary_parts.append(f"{i}. {issue}\n\n")
+
+summary_parts.append("\n" + "="*60 + "\n\n")
+summary_parts.append("CLEANING STEPS TAKEN:\n")
+for i, step in enumerate(cleaning_steps, 1):
+    summary_parts.append(f"{i}. {step}\n\n")
+
+summary_parts.append("\n" + "="*60 + "\n\n")
+summary_parts.append("KEY DESCRIPTIVE INDICATORS:\n")
+for key, value in summary_stats.items():
+    summary_parts.append(f"{key}: {value}\n")
+
+summary_parts.append("\n" + "="*60 + "\n\n")
+summary_parts.append("PRIMARY AGRICULTURAL SECTOR CLASSIFICATION LOGIC:\n")
+summary_parts.append("1. Compare four main sub-sectors: Crop, Livestock, Aquaculture, Fishing\n")
+summary_parts.append("2. Identify dominant sector with highest household count\n")
+summary_parts.append("3. Apply threshold: dominant sector must have ≥50% more households than second-largest\n")
+summary_parts.append("4. If threshold not met, classify as 'Mixed Agriculture'\n")
+summary_parts.append("5. Special case: If Crop and Livestock within 20%, classify as 'Crop-Livestock Mixed'\n\n")
+
+summary_parts.append("SECTOR DISTRIBUTION:\n")
+summary_parts.append(sector_distribution.to_string())
+
+summary_parts.append("\n\n" + "="*60 + "\n\n")
+summary_parts.append("POLICY-RELEVANT METRICS:\n\n")
+summary_parts.append("METRIC 1: Crop Yield Potential Intensity\n")
+summary_parts.append("Top 5 Counties:\n")
+summary_parts.append(top5_crop_intensity.to_string(index=False))
+
+summary_parts.append("\n\nMETRIC 2: Agricultural Engagement Rate\n")
+summary_parts.append("Top 5 Counties:\n")
+summary_parts.append(top5_engagement.to_string(index=False))
+summary_parts.append(f"\n\nCorrelation with Population Density: {correlation[0]:.3f} (p={correlation[1]:.4f})")
+
+with open('/home/ubuntu/agricultural_analysis/summary_statistics.txt', 'w', buffering=1 << 16) as f:
+    f.write(''.join(summary_parts))
 
 print("\nSummary statistics saved to: summary_statistics.txt")
 